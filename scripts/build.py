@@ -3,16 +3,44 @@
 """ cmake project builder """
 
 import subprocess
-import argparse
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Optional
 import os
+import re
 import locale
+import logging
+import sys
+import glob
 import json
+import shlex
 import shutil
+import uuid
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 MY_NAME: str = "C Project Builder"
 
+_PREFERRED_ENCODING: str = locale.getpreferredencoding(False)
+
+# parsed settings files, keyed on (path, mtime)
+_SETTINGS_CACHE: dict[tuple[str, int], Any] = {}
+
+# stat results of paths that do not change during a run
+_STAT_CACHE: dict[str, os.stat_result] = {}
+
+
+def _stat(path: str) -> Optional[os.stat_result]:
+    # 存在しないパスは後から作られることがあるため、キャッシュしない
+    if path not in _STAT_CACHE:
+        try:
+            _STAT_CACHE[path] = os.stat(path)
+        except FileNotFoundError:
+            return None
+    return _STAT_CACHE[path]
+
 
 # -----------------------------------
 # option
@@ -33,47 +61,36 @@ class Application:
         required: bool = True
         default: Any = ...
 
-    __parser: argparse.ArgumentParser
-
     def __init__(self):
-        self.__parser = argparse.ArgumentParser(description=MY_NAME)
+        self.__description: str = MY_NAME
+        self.__arguments: tuple[Application.PositionalArgument] = ()
+        self.__options: tuple[Application.Option] = ()
 
     def DefineArguments(
         self, arguments: tuple[PositionalArgument], options: tuple[Option]
     ) -> None:
-        for arg in arguments:
+        # パーサーはGetArgumentsで必要になるまで作らない
+        self.__arguments = arguments
+        self.__options = options
+
+    def GetArguments(self):
+        import argparse
+
+        parser = argparse.ArgumentParser(description=self.__description)
+        for arg in self.__arguments:
             nargs = None if arg.required else "?"
-            self.__parser.add_argument(
+            parser.add_argument(
                 arg.name, nargs=nargs, default=arg.default, help=arg.help
             )
-        for opt in options:
-            if opt.short is None:
-                if opt.needArgument:
-                    self.__parser.add_argument(
-                        "--" + opt.long, help=opt.help, default=opt.default
-                    )
-                else:
-                    self.__parser.add_argument(
-                        "--" + opt.long, help=opt.help, action="store_true"
-                    )
+        for opt in self.__options:
+            names = ["--" + opt.long]
+            if opt.short is not None:
+                names.insert(0, "-" + opt.short)
+            if opt.needArgument:
+                parser.add_argument(*names, help=opt.help, default=opt.default)
             else:
-                if opt.needArgument:
-                    self.__parser.add_argument(
-                        "-" + opt.short,
-                        "--" + opt.long,
-                        help=opt.help,
-                        default=opt.default,
-                    )
-                else:
-                    self.__parser.add_argument(
-                        "-" + opt.short,
-                        "--" + opt.long,
-                        help=opt.help,
-                        action="store_true",
-                    )
-
-    def GetArguments(self):
-        return self.__parser.parse_args()
+                parser.add_argument(*names, help=opt.help, action="store_true")
+        return parser.parse_args()
 
 
 # -----------------------------------
@@ -88,21 +105,44 @@ class BuildSetting:
         self.__path: str = os.path.join(directory, BuildSetting.FILE_NAME)
 
     def Load(self) -> None:
-        if not os.path.exists(self.__path):
-            raise RuntimeError(f"{BuildSetting.FILE_NAME} does not exist.")
-        jsonObject = self.__import()
+        try:
+            jsonObject = self.__import()
+        except FileNotFoundError:
+            raise RuntimeError(f"{BuildSetting.FILE_NAME} does not exist.") from None
         self.values.projectHome = jsonObject[BuildSetting.Name.PROJECT_HOME]
         self.values.buildDirectory = jsonObject[BuildSetting.Name.BUILD_DIR]
 
     def Create(self) -> None:
         if os.path.exists(self.__path):
             return
-        with open(self.__path, mode="w", encoding=locale.getpreferredencoding()) as f:
-            json.dump(self.__TEMPLATE, f, indent=2)
+        if orjson is not None:
+            # orjsonは常にUTF-8を出力するため、ロケールのエンコーディングに合わせる
+            data = (
+                orjson.dumps(self.__TEMPLATE, option=orjson.OPT_INDENT_2)
+                .decode("utf-8")
+                .encode(_PREFERRED_ENCODING)
+            )
+        else:
+            data = json.dumps(self.__TEMPLATE, indent=2).encode(_PREFERRED_ENCODING)
+        # 一時ファイルに書き込んでから置き換え、途中で中断しても壊れたファイルを残さない
+        tmpPath = self.__path + ".tmp"
+        with open(tmpPath, mode="wb") as f:
+            f.write(data)
+        os.replace(tmpPath, self.__path)
 
     def __import(self) -> Any:
-        with open(self.__path, encoding=locale.getpreferredencoding()) as f:
-            return json.load(f)
+        # 更新を検出するため、mtimeは毎回取得する
+        key = (self.__path, os.stat(self.__path).st_mtime_ns)
+        if key in _SETTINGS_CACHE:
+            return _SETTINGS_CACHE[key]
+        if orjson is not None:
+            with open(self.__path, mode="rb") as f:
+                jsonObject = orjson.loads(f.read().decode(_PREFERRED_ENCODING))
+        else:
+            with open(self.__path, encoding=_PREFERRED_ENCODING) as f:
+                jsonObject = json.load(f)
+        _SETTINGS_CACHE[key] = jsonObject
+        return jsonObject
 
     @property
     def __TEMPLATE(self) -> Any:
@@ -122,15 +162,13 @@ class BuildSetting:
 
 
 # -----------------------------------
-# static class: debug
+# debug logger
 # -----------------------------------
-class Debug:
-    enabled: bool = False
-
-    @classmethod
-    def Print(cls, message):
-        if cls.enabled:
-            print("[DEBUG]" + message)
+logger: logging.Logger = logging.getLogger("build")
+_handler = logging.StreamHandler(sys.stdout)
+_handler.setFormatter(logging.Formatter("[%(levelname)s]%(message)s"))
+logger.addHandler(_handler)
+logger.setLevel(logging.WARNING)
 
 
 # -----------------------------------
@@ -139,55 +177,211 @@ class Debug:
 # -----------------------------------
 class SubProcessWrapper:
     @staticmethod
-    def Run(args: tuple[str]) -> subprocess.CompletedProcess[bytes]:
-        return subprocess.run(args, check=True)
+    def Run(args: tuple[str], cwd: str = None) -> subprocess.CompletedProcess[bytes]:
+        return subprocess.run(args, check=True, cwd=cwd)
 
     @staticmethod
-    def RunSimply(args: tuple[str]) -> int:
+    def RunSimply(args: tuple[str], cwd: str = None) -> int:
         try:
-            return subprocess.run(args, check=True).returncode
+            return subprocess.run(args, check=True, cwd=cwd).returncode
         except subprocess.CalledProcessError as e:
             return e.returncode
 
     @staticmethod
-    def RunWithoutOutput(args: tuple[str]) -> int:
+    def RunWithoutOutput(args: tuple[str], cwd: str = None) -> int:
         try:
-            Debug.Print(f"run command: {args}")
+            logger.debug("run command: %s", args)
             return subprocess.run(
-                args, shell=True, check=True, capture_output=True
+                args, check=True, capture_output=True, cwd=cwd
             ).returncode
         except subprocess.CalledProcessError as e:
-            Debug.Print(f"error {e.returncode}: {e.stderr}")
+            logger.debug("error %s: %s", e.returncode, e.stderr)
             return e.returncode
 
+    @staticmethod
+    def RunDetached(args: tuple[str], cwd: str = None) -> None:
+        # 終了を待たず、このスクリプトの終了後も実行を続ける
+        logger.debug("run detached command: %s", args)
+        subprocess.Popen(
+            args,
+            cwd=cwd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+
+    @staticmethod
+    def GetOutput(args: tuple[str], cwd: str = None) -> str:
+        try:
+            logger.debug("run command: %s", args)
+            return subprocess.run(
+                args, check=True, capture_output=True, text=True, cwd=cwd
+            ).stdout
+        except (subprocess.CalledProcessError, OSError) as e:
+            logger.debug("error: %s", e)
+            return ""
+
 
 class Cmake:
     CMAKE: str = "cmake"
+    CCACHE: str = "ccache"
+    DISTCC: str = "distcc"
+    NINJA: str = "ninja"
+    NINJA_GENERATOR: str = "Ninja"
+    CACHE_FILE: str = "CMakeCache.txt"
+    CONFIGURED_STAMP: str = "build.py.configured"
+    FRESH_VERSION: tuple[int, ...] = (3, 24)
 
     def __init__(self, projectHome: str, buildDirectory: str) -> None:
-        if not os.path.exists(projectHome):
+        if _stat(projectHome) is None:
             raise FileNotFoundError(f"ProjectHome does not exist. '{projectHome}'")
-        if not os.path.exists(os.path.dirname(buildDirectory)):
+        if _stat(os.path.dirname(buildDirectory)) is None:
             raise FileNotFoundError(
                 f"BuildDirectory does not exist. '{buildDirectory}'"
             )
-        self.__projectHome: str = projectHome
-        self.__buildDirectory: str = buildDirectory
+        # cwdを変更せずに実行するため、絶対パスで保持する
+        self.__projectHome: str = os.path.abspath(projectHome)
+        self.__buildDirectory: str = os.path.abspath(buildDirectory)
+        self.__ccache: str = shutil.which(Cmake.CCACHE)
+        # オプションなしのビルドコマンドは事前に組み立てておく
+        self.__defaultBuildCommand: tuple[str, ...] = (
+            Cmake.CMAKE,
+            "--build",
+            self.__buildDirectory,
+            "--target",
+            "all",
+            "--parallel",
+            str(os.cpu_count() or 1),
+        )
+        self.__generator: str = (
+            Cmake.NINJA_GENERATOR if shutil.which(Cmake.NINJA) is not None else None
+        )
+        self.__version: tuple[int, ...] = None
 
-    def Configure(self) -> bool:
-        command: tuple[str] = [
+    def Configure(
+        self,
+        useCcache: bool = True,
+        generator: str = None,
+        unityBatch: int = None,
+        useDistcc: bool = False,
+        fresh: bool = False,
+    ) -> bool:
+        command: list[str] = [
             Cmake.CMAKE,
             "-S",
             self.__projectHome,
             "-B",
             self.__buildDirectory,
         ]
-        Debug.Print(f"command: {command}")
-        self.__Enter()
-        if SubProcessWrapper.RunSimply(command) == 0:
-            return True
-        self.__Exit()
-        return False
+        if fresh:
+            command.append("--fresh")
+        if generator is None and (
+            fresh
+            or not os.path.exists(os.path.join(self.__buildDirectory, Cmake.CACHE_FILE))
+        ):
+            # 既存のビルドディレクトリではジェネレータを変更できないため、初回のみ自動選択する
+            generator = self.__generator
+        if generator is not None and generator != "":
+            command.extend(["-G", generator])
+        # 以前の設定が残らないよう、無効にする場合も常に指定する
+        if unityBatch is not None:
+            command.extend(
+                [
+                    "-DCMAKE_UNITY_BUILD=ON",
+                    f"-DCMAKE_UNITY_BUILD_BATCH_SIZE={unityBatch}",
+                ]
+            )
+        else:
+            command.append("-DCMAKE_UNITY_BUILD=OFF")
+        # 以前のランチャーが残らないよう、空でも常に指定する
+        launcher = self.__Launcher(useCcache, useDistcc)
+        command.extend(
+            [
+                f"-DCMAKE_C_COMPILER_LAUNCHER={launcher}",
+                f"-DCMAKE_CXX_COMPILER_LAUNCHER={launcher}",
+            ]
+        )
+        # configureが失敗してもCMakeCache.txtは残るため、成功した時だけ印を残す
+        stampPath = os.path.join(self.__buildDirectory, Cmake.CONFIGURED_STAMP)
+        if os.path.exists(stampPath):
+            os.remove(stampPath)
+        logger.debug("command: %s", command)
+        if SubProcessWrapper.RunSimply(command, cwd=self.__projectHome) != 0:
+            return False
+        with open(stampPath, mode="w", encoding=_PREFERRED_ENCODING):
+            pass
+        return True
+
+    def IsConfigured(
+        self,
+        useCcache: bool = True,
+        generator: str = None,
+        unityBatch: int = None,
+        useDistcc: bool = False,
+    ) -> bool:
+        # 前回のconfigureが成功していて、cmakeファイルより新しく、
+        # オプションも一致すればconfigure済みとみなす
+        cachePath = os.path.join(self.__buildDirectory, Cmake.CACHE_FILE)
+        stampPath = os.path.join(self.__buildDirectory, Cmake.CONFIGURED_STAMP)
+        if not os.path.exists(cachePath) or not os.path.exists(stampPath):
+            return False
+        stampTime = os.stat(stampPath).st_mtime_ns
+        # generate済みであれば、サブディレクトリの変更はcmake --buildが自動で再configureする
+        sources = [os.path.join(self.__projectHome, "CMakeLists.txt")]
+        moduleDirectory = os.path.join(self.__projectHome, "cmake")
+        for directory in (self.__projectHome, moduleDirectory):
+            if os.path.isdir(directory):
+                sources.extend(
+                    entry.path
+                    for entry in os.scandir(directory)
+                    if entry.is_file() and entry.name.endswith(".cmake")
+                )
+        for source in sources:
+            if os.path.exists(source) and os.stat(source).st_mtime_ns > stampTime:
+                return False
+
+        entries = self.__ReadCache(cachePath)
+        expected: dict[str, str] = {}
+        launcher = self.__Launcher(useCcache, useDistcc)
+        expected["CMAKE_C_COMPILER_LAUNCHER"] = launcher
+        expected["CMAKE_CXX_COMPILER_LAUNCHER"] = launcher
+        if generator is not None and generator != "":
+            expected["CMAKE_GENERATOR"] = generator
+        if unityBatch is not None:
+            expected["CMAKE_UNITY_BUILD"] = "ON"
+            expected["CMAKE_UNITY_BUILD_BATCH_SIZE"] = str(unityBatch)
+        else:
+            expected["CMAKE_UNITY_BUILD"] = "OFF"
+        defaults: dict[str, str] = {"CMAKE_UNITY_BUILD": "OFF"}
+        for name, value in expected.items():
+            actual = entries.get(name, defaults.get(name, ""))
+            if actual != value:
+                logger.debug("%s changed: '%s' -> '%s'", name, actual, value)
+                return False
+        return True
+
+    def __Launcher(self, useCcache: bool, useDistcc: bool) -> str:
+        launchers: list[str] = []
+        if useCcache and self.__ccache is not None:
+            launchers.append(Cmake.CCACHE)
+        if useDistcc:
+            if shutil.which(Cmake.DISTCC) is None:
+                raise FileNotFoundError(f"'{Cmake.DISTCC}' is not installed.")
+            launchers.append(Cmake.DISTCC)
+        return ";".join(launchers)
+
+    @staticmethod
+    def __ReadCache(cachePath: str) -> dict[str, str]:
+        # e.g. "CMAKE_UNITY_BUILD:BOOL=ON"
+        entries: dict[str, str] = {}
+        with open(cachePath, encoding=_PREFERRED_ENCODING, errors="replace") as f:
+            for line in f:
+                if line.startswith(("#", "//")) or "=" not in line:
+                    continue
+                key, value = line.rstrip("\n").split("=", 1)
+                entries[key.split(":", 1)[0]] = value
+        return entries
 
     def Build(
         self,
@@ -195,37 +389,100 @@ class Cmake:
         buildType: str = None,
         enableVerbose: bool = False,
         cmakeArgs: tuple[str] = None,
+        jobs: int = None,
     ):
+        if (
+            target == "all"
+            and (buildType is None or buildType == "")
+            and not enableVerbose
+            and not cmakeArgs
+            and jobs is None
+        ):
+            logger.debug("command: %s", self.__defaultBuildCommand)
+            return (
+                SubProcessWrapper.RunSimply(
+                    self.__defaultBuildCommand, cwd=self.__projectHome
+                )
+                == 0
+            )
+        # 複数のターゲットは1回のcmake --buildにまとめ、ビルドツールに並列化させる
+        targets: list[str] = [t for t in target.split(",") if t != ""] or ["all"]
+        if jobs is None:
+            jobs = os.cpu_count() or 1
         command: list[str] = [
             Cmake.CMAKE,
             "--build",
             self.__buildDirectory,
             "--target",
-            target,
+            *targets,
+            "--parallel",
+            str(jobs),
         ]
         if buildType is not None and buildType != "":
             command.extend(["--config", buildType])
         if enableVerbose:
             command.append("-v")
-        if cmakeArgs is not None and cmakeArgs != [] and cmakeArgs != [""]:
+        if cmakeArgs:
             command.extend(cmakeArgs)
-        Debug.Print(f"command: {command}")
-        self.__Enter()
-        if SubProcessWrapper.RunSimply(command) == 0:
-            self.__Exit()
-            return True
-        self.__Exit()
-        return False
+        logger.debug("command: %s", command)
+        return SubProcessWrapper.RunSimply(command, cwd=self.__projectHome) == 0
+
+    def Clean(self) -> bool:
+        command: list[str] = [
+            Cmake.CMAKE,
+            "--build",
+            self.__buildDirectory,
+            "--target",
+            "clean",
+        ]
+        logger.debug("command: %s", command)
+        return SubProcessWrapper.RunSimply(command, cwd=self.__projectHome) == 0
+
+    def CanRefresh(self) -> bool:
+        # --freshはcmake 3.24以降で、configure済みのディレクトリのみ使える
+        if not os.path.exists(os.path.join(self.__buildDirectory, Cmake.CACHE_FILE)):
+            return False
+        return self.__Version() >= Cmake.FRESH_VERSION
+
+    def __Version(self) -> tuple[int, ...]:
+        if self.__version is None:
+            # e.g. "cmake version 3.28.3"
+            output = SubProcessWrapper.GetOutput([Cmake.CMAKE, "--version"])
+            numbers = re.search(r"(\d+)\.(\d+)", output)
+            self.__version = (
+                (int(numbers.group(1)), int(numbers.group(2))) if numbers else (0, 0)
+            )
+            logger.debug("cmake version: %s", self.__version)
+        return self.__version
 
     def Cleanup(self) -> None:
-        shutil.rmtree(self.__buildDirectory)
+        # 退避してからすぐに作り直し、古いディレクトリは別プロセスで削除する
+        oldDirectory = f"{self.__buildDirectory}.old.{uuid.uuid4().hex}"
+        os.rename(self.__buildDirectory, oldDirectory)
         os.mkdir(self.__buildDirectory)
-
-    def __Enter(self):
-        os.chdir(self.__projectHome)
-
-    def __Exit(self):
-        os.chdir(os.getenv("OLDPWD"))
+        self.RemoveOldDirectories()
+
+    def RemoveOldDirectories(self) -> None:
+        # 以前の削除が中断されて残ったディレクトリもまとめて削除する
+        # ユーザーのバックアップを消さないよう、Cleanupが付けた名前(uuid4().hex)に限る
+        prefix = f"{self.__buildDirectory}.old."
+        oldDirectories = [
+            path
+            for path in glob.glob(f"{glob.escape(prefix)}*")
+            if re.fullmatch(r"[0-9a-f]{32}", path[len(prefix) :])
+        ]
+        if not oldDirectories:
+            return
+        SubProcessWrapper.RunDetached(
+            [
+                sys.executable,
+                "-c",
+                "import shutil, sys\n"
+                "for path in sys.argv[1:]:\n"
+                "    shutil.rmtree(path, True)",
+                *oldDirectories,
+            ]
+        )
 
 
 # -----------------------------------
@@ -239,11 +496,18 @@ class ProjectBuilder:
         doCleanup: bool = False
         createSetting: bool = False
         isDebug: bool = False
+        useCcache: bool = True
+        jobs: int = None
+        generator: str = None
+        unityBatch: int = None
+        useDistcc: bool = False
+        forceConfiguration: bool = False
+        cmakeArgs: tuple[str, ...] = ()
 
     def __init__(self) -> None:
         self.__system: Application = Application()
         self.__system.DefineArguments(
-            self.__ArgumentDefinitions, self.__OptionDefinitions
+            ProjectBuilder.__ARGUMENT_DEFINITIONS, ProjectBuilder.__OPTION_DEFINITIONS
         )
         self.__controls: ProjectBuilder.Controls = ProjectBuilder.Controls()
         self.response: str = ""
@@ -257,10 +521,36 @@ class ProjectBuilder:
         self.__controls.doConfiguration = self.__arguments.configure
         self.__controls.doBuild = self.__arguments.build
         self.__controls.createSetting = self.__arguments.create_settings
-        Debug.enabled = self.__controls.isDebug
+        self.__controls.useCcache = not self.__arguments.no_ccache
+        if self.__arguments.jobs is not None:
+            self.__controls.jobs = self.__PositiveInteger(
+                self.__arguments.jobs, "-j/--jobs"
+            )
+        self.__controls.generator = self.__arguments.generator
+        if self.__arguments.unity is not None:
+            self.__controls.unityBatch = self.__PositiveInteger(
+                self.__arguments.unity, "--unity"
+            )
+        self.__controls.useDistcc = self.__arguments.distcc
+        self.__controls.cmakeArgs = tuple(shlex.split(self.__arguments.cmake_args))
+        # -cで明示的に指定された場合は常にconfigureする
+        self.__controls.forceConfiguration = (
+            self.__arguments.force_configure or self.__arguments.configure
+        )
+        logger.setLevel(logging.DEBUG if self.__controls.isDebug else logging.WARNING)
         self.__PrintArgument()
         self.__verifyControls()
 
+    @staticmethod
+    def __PositiveInteger(value: str, name: str) -> int:
+        try:
+            number = int(value)
+        except ValueError:
+            number = 0
+        if number <= 0:
+            raise ValueError(f"{name} must be a positive integer. '{value}'")
+        return number
+
     def __verifyControls(self) -> None:
         # どちらもfalseの時は、オプションなしなので、すべて実行する
         if not self.__controls.doConfiguration and not self.__controls.doBuild:
@@ -281,76 +571,142 @@ class ProjectBuilder:
             ),
         )
         if self.__controls.doCleanup:
-            cmake.Cleanup()
+            # キャッシュを作り直して成果物を削除すれば、ビルドツリー全体を削除する必要はない
+            # 失敗した場合は、ビルドディレクトリごと作り直す
+            if (
+                cmake.CanRefresh()
+                and self.__Configure(cmake, fresh=True)
+                and cmake.Clean()
+            ):
+                cmake.RemoveOldDirectories()
+            else:
+                cmake.Cleanup()
             self.response = "Cleaned up project repository."
             return
+        if (
+            self.__controls.doConfiguration
+            and not self.__controls.forceConfiguration
+            and cmake.IsConfigured(
+                self.__controls.useCcache,
+                self.__controls.generator,
+                self.__controls.unityBatch,
+                self.__controls.useDistcc,
+            )
+        ):
+            logger.debug("configure up to date")
+            self.__controls.doConfiguration = False
         if self.__controls.doConfiguration:
-            if not cmake.Configure():
+            if not self.__Configure(cmake):
                 return
         if self.__controls.doBuild:
             if not cmake.Build(
                 self.__arguments.target,
                 self.__arguments.type,
                 self.__arguments.verbose,
-                self.__arguments.cmake_args.split(","),
+                self.__controls.cmakeArgs,
+                self.__controls.jobs,
             ):
                 return
 
+    def __Configure(self, cmake: Cmake, fresh: bool = False) -> bool:
+        return cmake.Configure(
+            self.__controls.useCcache,
+            self.__controls.generator,
+            self.__controls.unityBatch,
+            self.__controls.useDistcc,
+            fresh,
+        )
+
     @property
     def controls(self) -> Controls:
         return self.__controls
 
-    @property
-    def __ArgumentDefinitions(self) -> tuple[Application.PositionalArgument]:
-        return [
-            Application.PositionalArgument(
-                name="target", required=False, default="all", help="Build target name."
-            ),
-        ]
-
-    @property
-    def __OptionDefinitions(self) -> tuple[Application.Option]:
-        return [
-            # short options
-            Application.Option(
-                short="c", long="configure", help="Only configure cmake."
-            ),
-            Application.Option(short="b", long="build", help="Only build."),
-            Application.Option(
-                short="v", long="verbose", help="Enable verbose output for cmake."
-            ),
-            Application.Option(
-                short="t",
-                long="type",
-                needArgument=True,
-                default="",
-                help="Specify build type. e.g. -t=Debug",
-            ),
-            # long options
-            Application.Option(long="clean", help="Cleanup the repository."),
-            Application.Option(
-                long="cmake-args",
-                needArgument=True,
-                default="",
-                help="Arguments passed to cmake. e.g. --cmake-args=arg1,arg2...",
-            ),
-            Application.Option(
-                long="create-settings", help=f"Create '{BuildSetting.FILE_NAME}'"
-            ),
-            Application.Option(long="debug", help="Output debug messages."),
-        ]
+    __ARGUMENT_DEFINITIONS: tuple[Application.PositionalArgument, ...] = (
+        Application.PositionalArgument(
+            name="target",
+            required=False,
+            default="all",
+            help="Build target name. Multiple targets are separated by commas.",
+        ),
+    )
+
+    __OPTION_DEFINITIONS: tuple[Application.Option, ...] = (
+        # short options
+        Application.Option(short="c", long="configure", help="Only configure cmake."),
+        Application.Option(short="b", long="build", help="Only build."),
+        Application.Option(
+            short="v", long="verbose", help="Enable verbose output for cmake."
+        ),
+        Application.Option(
+            short="t",
+            long="type",
+            needArgument=True,
+            default="",
+            help="Specify build type. e.g. -t=Debug",
+        ),
+        Application.Option(
+            short="j",
+            long="jobs",
+            needArgument=True,
+            default=None,
+            help="Number of parallel build jobs. (default: number of CPUs)",
+        ),
+        # long options
+        Application.Option(long="clean", help="Cleanup the repository."),
+        Application.Option(
+            long="cmake-args",
+            needArgument=True,
+            default="",
+            help='Arguments passed to cmake. e.g. --cmake-args="arg1 arg2..."',
+        ),
+        Application.Option(
+            long="create-settings", help=f"Create '{BuildSetting.FILE_NAME}'"
+        ),
+        Application.Option(long="debug", help="Output debug messages."),
+        Application.Option(
+            long="no-ccache", help="Do not use ccache even if it is installed."
+        ),
+        Application.Option(
+            long="generator",
+            needArgument=True,
+            default=None,
+            help="Specify cmake generator. (default: Ninja if installed)",
+        ),
+        Application.Option(
+            long="unity",
+            needArgument=True,
+            default=None,
+            help="Enable CMAKE_UNITY_BUILD with given batch size. "
+            "Speeds up clean builds, but incremental builds may be slower.",
+        ),
+        Application.Option(
+            long="force-configure",
+            help="Configure even if the cmake cache is up to date.",
+        ),
+        Application.Option(
+            long="distcc",
+            help="Distribute compilation with distcc (chained after ccache). "
+            "Combine with a -j value larger than the local CPU count.",
+        ),
+    )
 
     def __PrintArgument(self) -> None:
-        Debug.Print(f"target: {self.__arguments.target}")
-        Debug.Print("options:")
-        Debug.Print(f"  configure: {self.__arguments.configure}")
-        Debug.Print(f"  build: {self.__arguments.build}")
-        Debug.Print(f"  verbose: {self.__arguments.verbose}")
-        Debug.Print(f"  type: {self.__arguments.type}")
-        Debug.Print(f"  clean: {self.__arguments.clean}")
-        Debug.Print(f"  cmake-args: {self.__arguments.cmake_args}")
-        Debug.Print(f"  create-settings: {self.__arguments.create_settings}")
-        Debug.Print(f"  debug: {self.__arguments.debug}")
+        logger.debug("target: %s", self.__arguments.target)
+        logger.debug("options:")
+        logger.debug("  configure: %s", self.__arguments.configure)
+        logger.debug("  build: %s", self.__arguments.build)
+        logger.debug("  verbose: %s", self.__arguments.verbose)
+        logger.debug("  type: %s", self.__arguments.type)
+        logger.debug("  jobs: %s", self.__arguments.jobs)
+        logger.debug("  clean: %s", self.__arguments.clean)
+        logger.debug("  cmake-args: %s", self.__arguments.cmake_args)
+        logger.debug("  create-settings: %s", self.__arguments.create_settings)
+        logger.debug("  debug: %s", self.__arguments.debug)
+        logger.debug("  no-ccache: %s", self.__arguments.no_ccache)
+        logger.debug("  generator: %s", self.__arguments.generator)
+        logger.debug("  unity: %s", self.__arguments.unity)
+        logger.debug("  force-configure: %s", self.__arguments.force_configure)
+        logger.debug("  distcc: %s", self.__arguments.distcc)
 
 
 def main():